@@ -1,17 +1,29 @@
 """
 PulseCraft - Hackathon Presentation Generator
 This script generates a PowerPoint presentation for the hackathon submission
+
+Usage:
+    python create_presentation.py            # build the deck once
+    python create_presentation.py --watch    # rebuild on every save of this script
+
+In watch mode pptx stays imported and only the slides whose add_*_slide
+function changed are rebuilt; the rest are copied from the previous build.
 """
 
+import argparse
+import ast
+import copy
+import hashlib
+import os
+import sys
+import time
+
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN
 from pptx.dml.color import RGBColor
 
-# Create presentation
-prs = Presentation()
-prs.slide_width = Inches(10)
-prs.slide_height = Inches(7.5)
+OUTPUT_FILE = "PulseCraft_Hackathon_Presentation.pptx"
 
 # Define color scheme (Azure blue theme)
 AZURE_BLUE = RGBColor(0, 120, 212)
@@ -634,32 +646,156 @@ def add_thank_you_slide(prs):
         para.font.color.rgb = WHITE
         para.alignment = PP_ALIGN.CENTER
 
-# Generate all slides
-print("Creating PulseCraft Hackathon Presentation...")
-add_title_slide(prs)
-add_problem_slide(prs)
-add_solution_slide(prs)
-add_architecture_slide(prs)
-add_agent_workflow_slide(prs)
-add_azure_services_slide(prs)
-add_demo_slide(prs)
-add_tech_stack_slide(prs)
-add_value_proposition_slide(prs)
-add_impact_slide(prs)
-add_challenges_slide(prs)
-add_roadmap_slide(prs)
-add_team_slide(prs)
-add_thank_you_slide(prs)
-
-# Save presentation
-output_file = "PulseCraft_Hackathon_Presentation.pptx"
-prs.save(output_file)
-print(f"✓ Presentation created: {output_file}")
-print(f"✓ Total slides: {len(prs.slides)}")
-print("\nNext steps:")
-print("1. Open in Microsoft PowerPoint")
-print("2. Add team member names on Slide 13")
-print("3. Insert actual architecture diagram on Slide 4")
-print("4. Add demo screenshots on Slide 7")
-print("5. Customize colors/fonts to match your brand")
-print("6. Add your contact information on final slide")
+SLIDE_BUILDERS = [
+    add_title_slide,
+    add_problem_slide,
+    add_solution_slide,
+    add_architecture_slide,
+    add_agent_workflow_slide,
+    add_azure_services_slide,
+    add_demo_slide,
+    add_tech_stack_slide,
+    add_value_proposition_slide,
+    add_impact_slide,
+    add_challenges_slide,
+    add_roadmap_slide,
+    add_team_slide,
+    add_thank_you_slide,
+]
+
+def build_presentation(output_file=OUTPUT_FILE, cache=None, fingerprints=None):
+    """Build every slide and save the deck, returning the Presentation
+
+    When a cache dict and slide fingerprints are given, slides whose
+    fingerprint matches the cached one are copied instead of rebuilt.
+    """
+    prs = Presentation()
+    prs.slide_width = Inches(10)
+    prs.slide_height = Inches(7.5)
+    for add_slide in SLIDE_BUILDERS:
+        name = add_slide.__name__
+        key = fingerprints.get(name) if fingerprints else None
+        cached = cache.get(name) if cache is not None else None
+        if key and cached and cached[0] == key:
+            slide = prs.slides.add_slide(prs.slide_layouts[6])
+            blank = slide._element.cSld
+            blank.getparent().replace(blank, copy.deepcopy(cached[1]))
+            continue
+        add_slide(prs)
+        if cache is not None and key:
+            cache[name] = (key, copy.deepcopy(prs.slides[-1]._element.cSld))
+    prs.save(output_file)
+    return prs
+
+def slide_fingerprints(source):
+    """Hash each add_*_slide function together with the rest of the module
+
+    Editing one slide function only changes that slide's fingerprint; editing
+    anything else (colors, imports, helpers) changes all of them.
+    """
+    lines = source.splitlines(keepends=True)
+    slide_sources = {}
+    shared_lines = list(lines)
+    for node in ast.parse(source).body:
+        if isinstance(node, ast.FunctionDef) and node.name.startswith("add_") and node.name.endswith("_slide"):
+            slide_sources[node.name] = b"".join(lines[node.lineno - 1:node.end_lineno])
+            shared_lines[node.lineno - 1:node.end_lineno] = [b""] * (node.end_lineno - node.lineno + 1)
+    shared = hashlib.sha1(b"".join(shared_lines))
+    fingerprints = {}
+    for name, segment in slide_sources.items():
+        digest = shared.copy()
+        digest.update(segment)
+        fingerprints[name] = digest.hexdigest()
+    return fingerprints
+
+def load_deck_source(path):
+    """Re-execute the deck definitions from path without re-importing pptx"""
+    with open(path, "rb") as f:
+        source = f.read()
+    namespace = {"__name__": "pulsecraft_deck", "__file__": path}
+    exec(compile(source, path, "exec"), namespace)
+    return namespace, slide_fingerprints(source)
+
+def watch(output_file=OUTPUT_FILE, interval=0.01, debounce=0.03):
+    """Poll the deck source and rebuild the presentation whenever it changes
+
+    pptx stays imported between rebuilds, so only the slide code is re-run,
+    and only for slides whose source changed. Bursts of writes are coalesced:
+    a rebuild starts once the file has been quiet for `debounce` seconds.
+    Saves that leave every slide unchanged (e.g. a bare touch) are skipped.
+    """
+    source_path = os.path.abspath(__file__)
+    cache = {}
+    with open(source_path, "rb") as f:
+        last_fingerprints = slide_fingerprints(f.read())
+    build_presentation(output_file, cache, last_fingerprints)
+    last_mtime = os.stat(source_path).st_mtime_ns
+    print(f"✓ Watching {os.path.basename(source_path)} -> {output_file} (Ctrl+C to stop)")
+
+    try:
+        while True:
+            time.sleep(interval)
+            try:
+                mtime = os.stat(source_path).st_mtime_ns
+            except FileNotFoundError:
+                # Editors that save via rename briefly remove the file
+                continue
+            if mtime == last_mtime:
+                continue
+
+            # Debounce: wait until the file stops changing
+            changed_at = time.perf_counter()
+            while True:
+                time.sleep(interval)
+                try:
+                    current = os.stat(source_path).st_mtime_ns
+                except FileNotFoundError:
+                    continue
+                if current != mtime:
+                    mtime = current
+                    changed_at = time.perf_counter()
+                elif time.perf_counter() - changed_at >= debounce:
+                    break
+            last_mtime = mtime
+
+            start = time.perf_counter()
+            try:
+                namespace, fingerprints = load_deck_source(source_path)
+                if fingerprints == last_fingerprints:
+                    continue
+                prs = namespace["build_presentation"](output_file, cache, fingerprints)
+            except Exception as exc:
+                print(f"✗ Rebuild failed: {type(exc).__name__}: {exc}", file=sys.stderr)
+                continue
+            changed = sum(1 for name, key in fingerprints.items() if last_fingerprints.get(name) != key)
+            last_fingerprints = fingerprints
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            print(f"✓ Rebuilt {output_file} ({changed}/{len(prs.slides)} slides re-rendered) in {elapsed_ms:.0f} ms")
+    except KeyboardInterrupt:
+        print("\nStopped watching.")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate the PulseCraft hackathon presentation")
+    parser.add_argument("-o", "--output", default=OUTPUT_FILE, help="output .pptx path")
+    parser.add_argument("--watch", action="store_true",
+                        help="keep running and rebuild whenever this script is saved")
+    args = parser.parse_args(argv)
+
+    if args.watch:
+        watch(args.output)
+        return
+
+    print("Creating PulseCraft Hackathon Presentation...")
+    prs = build_presentation(args.output)
+    print(f"✓ Presentation created: {args.output}")
+    print(f"✓ Total slides: {len(prs.slides)}")
+    print("\nNext steps:")
+    print("1. Open in Microsoft PowerPoint")
+    print("2. Add team member names on Slide 13")
+    print("3. Insert actual architecture diagram on Slide 4")
+    print("4. Add demo screenshots on Slide 7")
+    print("5. Customize colors/fonts to match your brand")
+    print("6. Add your contact information on final slide")
+
+if __name__ == "__main__":
+    main()